@@ -1,89 +1,198 @@
+import bisect
+import dbm
+import functools
+import hashlib
+import io
+import itertools
+import json
+import operator
 import os
+import pickle
+import queue
+import re
+import shelve
+import shutil
+import struct
 import subprocess
 import tempfile
+import threading
+import time
 import tkinter as tk
-from tkinter import filedialog, scrolledtext, messagebox, ttk, font
 import urllib.request
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import font, messagebox, scrolledtext, ttk
 from tkinter.constants import *
-import re
-import threading
-import time
-import ast
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 
 # Path for storing CFR JAR file
 DECOMP_DIR = os.path.dirname(os.path.abspath(__file__))
 CFR_JAR_PATH = os.path.join(DECOMP_DIR, "cfr-0.152.jar")
+# Persistent cache of javap output, keyed by class file path, mtime and size; one entry per path
+DISASM_CACHE_PATH = os.path.join(DECOMP_DIR, ".javap_cache")
+_disasm_cache = None  # Opened on first use; False once it has failed to open
+_disasm_cache_lock = threading.Lock()
+# What a missing, locked or corrupt cache file can raise; the cache is only an optimization
+_DISASM_CACHE_ERRORS = (*dbm.error, EOFError, pickle.UnpicklingError)
+# Persistent cache of CFR output, one file per class file SHA-1, evicted oldest first
+CFR_CACHE_DIR = os.path.join(DECOMP_DIR, "cfr_cache")
+CFR_CACHE_INDEX_PATH = os.path.join(CFR_CACHE_DIR, "index.json")
+CFR_CACHE_MAX_ENTRIES = 500
+_CFR_CACHE_FILE_RE = re.compile(r'[0-9a-f]{40}\.java')  # Cached sources are named by SHA-1
+_cfr_cache_lock = threading.Lock()
+# Long-lived CFR JVM that decompiles one class file per request read from stdin.
+# Its wrapper source is generated next to the cached output.
+CFR_WORKER_PATH = os.path.join(CFR_CACHE_DIR, "CfrWorker.java")
+CFR_TIMEOUT = 60  # Seconds to wait for CFR on one class file
+CFR_WORKER_MAX_FAILURES = 3  # Worker crashes in a row before falling back to a JVM per file
+_cfr_worker = None
+_cfr_worker_failures = 0
+_cfr_worker_lock = threading.Lock()
+# Whether a working java executable was found, see java_available
+_JAVA_OK: Optional[bool] = None
+# Println results kept per debugger; a runaway loop drops the oldest first
+PROGRAM_OUTPUT_MAX_ENTRIES = 50_000
+# Lines kept in the console and program output panes; older lines are dropped
+OUTPUT_MAX_LINES = 5000
+# Worker pool for loading class files off the UI thread
+_worker_pool = ThreadPoolExecutor(max_workers=2)
+
+# Patterns used to parse javap output, compiled once at import time
+# Source line markers and bytecode instructions, matched in a single scan
+_BC_RE = re.compile(
+    r"(?P<line>line (?P<line_no>\d+):)"
+    r"|(?P<instr>^[^\S\n]*(?P<offset>\d+): (?P<opcode>[a-zA-Z_]+)(?P<operands>.*?)(?://.*)?$)",
+    re.MULTILINE
+)
+# String and Utf8 constant pool entries
+_CONST_RE = re.compile(r'#(?P<index>\d+)\s+=\s+(?:String\s+#\d+\s+//\s+|Utf8\s+)(?P<value>.+)$')
+# Constant pool reference in an instruction operand, e.g. "#13"
+_CP_INDEX_RE = re.compile(r'#(\d+)')
 
 class LineNumberCanvas(tk.Canvas):
     def __init__(self, parent, text_widget, *args, **kwargs):
         tk.Canvas.__init__(self, parent, *args, **kwargs)
         self.text_widget = text_widget
         self.breakpoints = set()
+        self._pending_redraw = False  # A redraw is queued for the next idle moment
+        # Canvas items are pooled and reused by screen position across redraws
+        self._item_pool = []  # Line number text items
+        self._bp_pool = []  # Breakpoint marker items
+        self._items_shown = 0
+        self._bps_shown = 0
         self.text_widget.bind("<Configure>", self.on_text_changed)
-        self.text_widget.bind("<KeyRelease>", self.on_text_changed)
-        self.text_widget.bind("<MouseWheel>", self.on_text_changed)
         self.bind("<Button-1>", self.toggle_breakpoint)
         
-        # Configure text widget to update on scrolling
-        self.text_widget.bind("<<Modified>>", self.on_text_changed)
+        # Chain onto the text widget's scroll callback, which fires whenever its view
+        # changes (scrolling, inserts, see()), instead of redrawing on every keystroke
+        self._scroll_command = str(self.text_widget.cget("yscrollcommand"))
+        self.text_widget.configure(yscrollcommand=self.on_text_scrolled)
         
     def toggle_breakpoint(self, event):
         # Get the y coordinate of the click
         y = event.y
         
-        # Find the closest line number to the click
-        first_line = int(self.text_widget.index("@0,0").split('.')[0])
-        last_line = int(self.text_widget.index(f"@0,{self.text_widget.winfo_height()}").split('.')[0])
+        # Let the text widget resolve the line under the click
+        line_num = int(self.text_widget.index(f"@0,{y}").split('.')[0])
         
-        for line_num in range(first_line, last_line + 1):
-            line_info = self.text_widget.dlineinfo(f"{line_num}.0")
-            if line_info:  # line_info can be None if the line is not visible
-                line_y = line_info[1]  # y-coordinate of the line
-                line_height = line_info[3]  # height of the line
-                
-                # Check if click is on this line
-                if line_y <= y <= line_y + line_height:
-                    # Toggle breakpoint
-                    if line_num in self.breakpoints:
-                        self.breakpoints.remove(line_num)
-                    else:
-                        self.breakpoints.add(line_num)
-                    self.redraw()
-                    return
+        # Ignore clicks below the last line, which still resolve to it
+        line_info = self.text_widget.dlineinfo(f"{line_num}.0")
+        if not line_info or y > line_info[1] + line_info[3]:
+            return
+        
+        # Toggle breakpoint
+        if line_num in self.breakpoints:
+            self.breakpoints.remove(line_num)
+        else:
+            self.breakpoints.add(line_num)
+        self.schedule_redraw()
         
     def get_breakpoints(self):
         return sorted(list(self.breakpoints))
         
     def on_text_changed(self, event=None):
+        self.schedule_redraw()
+    
+    def schedule_redraw(self):
+        # Coalesce bursts of scroll/resize events into one redraw once Tk is idle
+        if not self._pending_redraw:
+            self._pending_redraw = True
+            self.after_idle(self._do_redraw)
+    
+    def on_text_scrolled(self, first, last):
+        if self._scroll_command:
+            self.tk.eval(f"{self._scroll_command} {first} {last}")
+        self.on_text_changed()
+    
+    def _do_redraw(self):
+        self._pending_redraw = False
         self.redraw()
             
     def redraw(self):
-        self.delete("all")
-        
         # Get the first and last visible line of the text widget
         first_line = int(self.text_widget.index("@0,0").split('.')[0])
         last_line = int(self.text_widget.index(f"@0,{self.text_widget.winfo_height()}").split('.')[0])
         
         # Calculate the width needed for line numbers
         width = int(self.cget("width"))
+        text_x = width - 8
+        circle_x = width - 12
+        radius = 6
         
-        # Draw each line number
+        # Only visible lines get items, taken from the pools in screen order
+        items_used = 0
+        bps_used = 0
         for line_num in range(first_line, last_line + 1):
             y = self.text_widget.dlineinfo(f"{line_num}.0")
             if y:
-                text_x = width - 8
                 if line_num in self.breakpoints:
                     # Draw a red circle for breakpoints
-                    circle_x = width - 12
                     circle_y = y[1] + y[3]//2
-                    radius = 6
-                    self.create_oval(circle_x-radius, circle_y-radius, 
-                                    circle_x+radius, circle_y+radius, 
-                                    fill="red", outline="red")
+                    coords = (circle_x-radius, circle_y-radius, circle_x+radius, circle_y+radius)
+                    if bps_used < len(self._bp_pool):
+                        item = self._bp_pool[bps_used]
+                        self.coords(item, *coords)
+                        self.itemconfigure(item, state="normal")
+                    else:
+                        self._bp_pool.append(self.create_oval(*coords, fill="red", outline="red"))
+                    bps_used += 1
                 
                 # Always draw the line number
-                self.create_text(text_x, y[1], anchor="ne", text=str(line_num))
+                if items_used < len(self._item_pool):
+                    item = self._item_pool[items_used]
+                    self.coords(item, text_x, y[1])
+                    self.itemconfigure(item, text=str(line_num), state="normal")
+                else:
+                    self._item_pool.append(self.create_text(
+                        text_x, y[1], anchor="ne", text=str(line_num), tags="line_number"))
+                items_used += 1
+        
+        # Hide pooled items that are no longer needed
+        for item in self._item_pool[items_used:self._items_shown]:
+            self.itemconfigure(item, state="hidden")
+        for item in self._bp_pool[bps_used:self._bps_shown]:
+            self.itemconfigure(item, state="hidden")
+        self._items_shown = items_used
+        self._bps_shown = bps_used
+        
+        # Keep line numbers drawn above breakpoint markers
+        self.tag_raise("line_number")
+
+def java_available():
+    """Check once whether Java is installed and runs"""
+    global _JAVA_OK
+    if _JAVA_OK is None:
+        # Look on PATH first so a missing Java costs no process start
+        _JAVA_OK = False
+        if shutil.which('java'):
+            try:
+                subprocess.run(['java', '-version'], capture_output=True, timeout=2)
+                _JAVA_OK = True
+            except subprocess.TimeoutExpired:
+                _JAVA_OK = True  # Slow to start, but it is there
+            except OSError:
+                pass
+    return _JAVA_OK
 
 def download_cfr():
     """Download CFR decompiler if not already present"""
@@ -93,34 +202,490 @@ def download_cfr():
         urllib.request.urlretrieve(url, CFR_JAR_PATH)
         print("CFR decompiler downloaded successfully.")
 
+def _iter_lines(text):
+    """Iterate over the lines of a string, or pass an iterable of lines through"""
+    return io.StringIO(text) if isinstance(text, str) else text
+
+def _common_prefix_length(a, b):
+    """Length of the longest common prefix of two strings, by bisecting on slice comparisons"""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def _disasm_cache_key(class_file):
+    st = os.stat(class_file)
+    return f"{os.path.abspath(class_file)}:{st.st_mtime_ns}:{st.st_size}"
+
 def disassemble_class(class_file):
-    """Disassemble Java class file using javap"""
-    result = subprocess.run(['javap', '-c', '-l', '-verbose', class_file], capture_output=True, text=True)
-    return result.stdout
+    """Disassemble Java class file using javap, yielding output lines as they are produced.
+    
+    Output for an unchanged file is served from the on-disk cache. The generator
+    returns True when javap succeeded.
+    """
+    key = _disasm_cache_key(class_file)
+    cached = _read_disasm_cache(key)
+    if cached is not None:
+        yield from io.StringIO(cached)
+        return True
+    
+    lines = []  # Kept only to populate the cache
+    with subprocess.Popen(['javap', '-c', '-l', '-verbose', class_file],
+                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
+        for line in proc.stdout:
+            lines.append(line)
+            yield line
+    if proc.returncode != 0:
+        return False
+    _write_disasm_cache(key, "".join(lines))
+    return True
+
+def _open_disasm_cache():
+    """Return the javap cache shelf, or None if it can't be used. Call with _disasm_cache_lock held."""
+    global _disasm_cache
+    if _disasm_cache is None:
+        try:
+            _disasm_cache = shelve.open(DISASM_CACHE_PATH)
+        except _DISASM_CACHE_ERRORS as e:
+            print(f"Error opening disassembly cache, running javap uncached: {e}")
+            _disasm_cache = False
+    # An empty shelf is falsy, so test for the failure marker explicitly
+    return None if _disasm_cache is False else _disasm_cache
+
+def _read_disasm_cache(key):
+    """Return cached javap output for a cache key, or None"""
+    with _disasm_cache_lock:
+        cache = _open_disasm_cache()
+        if cache is None:
+            return None
+        try:
+            return cache.get(key)
+        except _DISASM_CACHE_ERRORS as e:
+            print(f"Error reading disassembly cache: {e}")
+            return None
+
+def _write_disasm_cache(key, output):
+    """Store javap output, replacing entries for older builds of the same file"""
+    with _disasm_cache_lock:
+        cache = _open_disasm_cache()
+        if cache is None:
+            return
+        try:
+            # Drop entries for older builds of this file, so recompiling doesn't grow the cache
+            path = key.rsplit(':', 2)[0]
+            for old_key in [k for k in cache.keys() if k.rsplit(':', 2)[0] == path]:
+                del cache[old_key]
+            cache[key] = output
+            cache.sync()
+        except _DISASM_CACHE_ERRORS as e:
+            print(f"Error caching disassembly: {e}")
+
+def disassemble_class_to_string(class_file):
+    """Disassemble Java class file using javap and return the whole output"""
+    return "".join(disassemble_class(class_file))
+
+class _ToolFailure(Exception):
+    """Raised by the memoized loaders so that failed output is never cached"""
+    def __init__(self, output):
+        super().__init__(output)
+        self.output = output
+
+@functools.lru_cache(maxsize=64)
+def _cached_disassembly(class_file, mtime_ns, size):
+    lines = []
+    output = disassemble_class(class_file)
+    try:
+        while True:
+            lines.append(next(output))
+    except StopIteration as done:
+        if not done.value:
+            raise _ToolFailure("".join(lines))
+    return "".join(lines)
+
+@functools.lru_cache(maxsize=64)
+def _cached_decompilation(class_file, mtime_ns, size):
+    ok, output = _decompile_class(class_file)
+    if not ok:
+        raise _ToolFailure(output)
+    return output
+
+def _memoized_output(loader, key):
+    """Call a memoized loader, returning failed output without caching it"""
+    try:
+        return loader(*key)
+    except _ToolFailure as e:
+        return e.output
+
+# Sizes of the fixed-length constant pool entries, by tag (JVMS 4.4)
+_CP_ENTRY_SIZES = {3: 4, 4: 4, 5: 8, 6: 8, 7: 2, 8: 2, 9: 4, 10: 4, 11: 4,
+                   12: 4, 15: 3, 16: 2, 17: 4, 18: 4, 19: 2, 20: 2}
+
+def read_class_references(class_file):
+    """Read a class file's own internal name (e.g. "com/foo/Bar") and the set of
+    classes it references, straight from its constant pool"""
+    with open(class_file, 'rb') as f:
+        data = f.read()
+    if data[:4] != b'\xca\xfe\xba\xbe':
+        raise ValueError(f"Not a Java class file: {class_file}")
+    
+    # Header: magic, minor_version, major_version, constant_pool_count
+    cp_count, = struct.unpack_from('>H', data, 8)
+    utf8 = {}
+    class_entries = []  # (constant pool index, name index) of each Class entry
+    pos = 10
+    index = 1
+    while index < cp_count:
+        tag = data[pos]
+        if tag == 1:  # CONSTANT_Utf8
+            length, = struct.unpack_from('>H', data, pos + 1)
+            utf8[index] = data[pos + 3:pos + 3 + length].decode('utf-8', errors='replace')
+            pos += 3 + length
+        elif tag in _CP_ENTRY_SIZES:
+            if tag == 7:  # CONSTANT_Class
+                class_entries.append((index, struct.unpack_from('>H', data, pos + 1)[0]))
+            pos += 1 + _CP_ENTRY_SIZES[tag]
+        else:
+            raise ValueError(f"Unknown constant pool tag {tag} in {class_file}")
+        # Long and Double entries take up two slots
+        index += 2 if tag in (5, 6) else 1
+    
+    # access_flags follows the constant pool, then this_class
+    this_class, = struct.unpack_from('>H', data, pos + 2)
+    this_name = ''
+    refs = set()
+    for cp_index, name_index in class_entries:
+        name = utf8.get(name_index, '')
+        if cp_index == this_class:
+            this_name = name
+        elif not name.startswith(('java/lang/', '[')):
+            refs.add(name)
+    return this_name, refs
+
+def _load_cfr_cache_index():
+    """Load the cache index, mapping SHA-1 keys to the time each entry was stored.
+    
+    A missing or unreadable index is rebuilt from the cached files, so no entry
+    ever escapes eviction.
+    """
+    try:
+        with open(CFR_CACHE_INDEX_PATH, encoding='utf-8') as f:
+            index = json.load(f)
+        if isinstance(index, dict):
+            return index
+    except (OSError, ValueError):
+        pass
+    index = {}
+    try:
+        with os.scandir(CFR_CACHE_DIR) as it:
+            for entry in it:
+                if _CFR_CACHE_FILE_RE.fullmatch(entry.name):
+                    index[entry.name[:-len(".java")]] = entry.stat().st_mtime
+    except OSError:
+        pass
+    return index
+
+def _save_cfr_cache_index(index):
+    # Write a temporary file and swap it in, so a crash never leaves a truncated index
+    fd, tmp_path = tempfile.mkstemp(dir=CFR_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, CFR_CACHE_INDEX_PATH)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _read_cfr_cache(key):
+    """Return cached CFR output for a class file hash, or None.
+    
+    Reads leave the index alone; the in-memory loaders in front of this make
+    hits rare, so eviction by storage time is close enough to LRU.
+    """
+    with _cfr_cache_lock:
+        try:
+            with open(os.path.join(CFR_CACHE_DIR, key + ".java"), encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+def _write_cfr_cache(key, source):
+    """Store CFR output and evict the oldest entries beyond the limit"""
+    with _cfr_cache_lock:
+        try:
+            os.makedirs(CFR_CACHE_DIR, exist_ok=True)
+            with open(os.path.join(CFR_CACHE_DIR, key + ".java"), 'w', encoding='utf-8') as f:
+                f.write(source)
+            index = _load_cfr_cache_index()
+            index[key] = time.time()
+            excess = len(index) - CFR_CACHE_MAX_ENTRIES
+            if excess > 0:
+                for old_key in sorted(index, key=index.get)[:excess]:
+                    del index[old_key]
+                    try:
+                        os.remove(os.path.join(CFR_CACHE_DIR, old_key + ".java"))
+                    except OSError:
+                        pass
+            _save_cfr_cache_index(index)
+        except OSError as e:
+            # The cache is only an optimization
+            print(f"Error caching decompiled source: {e}")
+
+# Java wrapper run by the CFR worker. It reads NUL-terminated class file paths
+# and answers each with a status byte (0 = ok), a 4-byte length and UTF-8 text.
+CFR_WORKER_SOURCE = """\
+import java.io.*;
+import java.nio.charset.StandardCharsets;
+import java.util.*;
+import org.benf.cfr.reader.api.CfrDriver;
+import org.benf.cfr.reader.api.OutputSinkFactory;
+
+public class CfrWorker {
+    public static void main(String[] args) throws IOException {
+        InputStream in = new BufferedInputStream(System.in);
+        DataOutputStream out = new DataOutputStream(new BufferedOutputStream(System.out));
+        ByteArrayOutputStream path = new ByteArrayOutputStream();
+        int b;
+        while ((b = in.read()) != -1) {
+            if (b != 0) {
+                path.write(b);
+                continue;
+            }
+            String classFile = new String(path.toByteArray(), StandardCharsets.UTF_8);
+            path.reset();
+            StringBuilder source = new StringBuilder();
+            StringBuilder errors = new StringBuilder();
+            try {
+                decompile(classFile, source, errors);
+            } catch (Throwable t) {
+                errors.append(t).append('\\n');
+            }
+            boolean ok = source.length() > 0 || errors.length() == 0;
+            byte[] payload = (ok ? source : errors).toString().getBytes(StandardCharsets.UTF_8);
+            out.writeByte(ok ? 0 : 1);
+            out.writeInt(payload.length);
+            out.write(payload);
+            out.flush();
+        }
+    }
+
+    private static void decompile(String classFile, StringBuilder source, StringBuilder errors) {
+        OutputSinkFactory sinks = new OutputSinkFactory() {
+            @Override
+            public List<SinkClass> getSupportedSinks(SinkType sinkType, Collection<SinkClass> available) {
+                return Collections.singletonList(SinkClass.STRING);
+            }
+
+            @Override
+            public <T> Sink<T> getSink(SinkType sinkType, SinkClass sinkClass) {
+                if (sinkType == SinkType.JAVA) {
+                    return x -> source.append(x);
+                }
+                if (sinkType == SinkType.EXCEPTION) {
+                    return x -> errors.append(x).append('\\n');
+                }
+                return x -> { };
+            }
+        };
+        new CfrDriver.Builder().withOutputSink(sinks).build().analyse(Collections.singletonList(classFile));
+    }
+}
+"""
+
+def _read_exactly(stream, size):
+    data = b''
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            raise EOFError("CFR worker exited")
+        data += chunk
+    return data
+
+class _CfrWorker:
+    """A CFR JVM answering decompile requests over its stdin and stdout"""
+    def __init__(self):
+        # Write the wrapper source if needed and launch it with CFR on the classpath
+        os.makedirs(CFR_CACHE_DIR, exist_ok=True)
+        try:
+            with open(CFR_WORKER_PATH, encoding='utf-8') as f:
+                current = f.read()
+        except OSError:
+            current = None
+        if current != CFR_WORKER_SOURCE:
+            with open(CFR_WORKER_PATH, 'w', encoding='utf-8') as f:
+                f.write(CFR_WORKER_SOURCE)
+        # Single-file source launch needs Java 11+
+        self.process = subprocess.Popen(['java', '-cp', CFR_JAR_PATH, CFR_WORKER_PATH],
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL, bufsize=0)
+        # Replies are read on their own thread so a hung CFR can be timed out
+        self.replies = queue.Queue()
+        threading.Thread(target=self._read_replies, daemon=True).start()
+    
+    def _read_replies(self):
+        stdout = self.process.stdout
+        try:
+            while True:
+                status, length = struct.unpack('>BI', _read_exactly(stdout, 5))
+                self.replies.put((status == 0, _read_exactly(stdout, length).decode('utf-8')))
+        except (OSError, EOFError, ValueError) as e:
+            self.replies.put(e)
+    
+    def running(self):
+        return self.process.poll() is None
+    
+    def decompile(self, class_file, timeout):
+        """Return (ok, text) for one class file; raises TimeoutError if CFR doesn't answer in time"""
+        self.process.stdin.write(os.path.abspath(class_file).encode('utf-8') + b'\0')
+        try:
+            reply = self.replies.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"CFR took longer than {timeout} seconds") from None
+        if isinstance(reply, Exception):
+            raise EOFError("CFR worker exited") from reply
+        return reply
+    
+    def close(self):
+        self.process.kill()
+
+def _decompile_with_worker(class_file):
+    """Send one class file to the CFR worker, returning (ok, text), or None if it can't run.
+    
+    A crashed worker is restarted on the next request, until it has failed
+    CFR_WORKER_MAX_FAILURES times in a row. A timeout kills the worker and is
+    raised, since a per-file JVM would hang on the same class.
+    """
+    global _cfr_worker, _cfr_worker_failures
+    with _cfr_worker_lock:
+        if _cfr_worker_failures >= CFR_WORKER_MAX_FAILURES:
+            return None
+        try:
+            if _cfr_worker is None or not _cfr_worker.running():
+                _cfr_worker = None  # Forget a dead worker even if the restart fails
+                _cfr_worker = _CfrWorker()
+            result = _cfr_worker.decompile(class_file, CFR_TIMEOUT)
+        except TimeoutError:
+            _cfr_worker.close()
+            _cfr_worker = None
+            raise
+        except (OSError, EOFError):
+            if _cfr_worker is not None:
+                _cfr_worker.close()
+                _cfr_worker = None
+            _cfr_worker_failures += 1
+            return None
+        _cfr_worker_failures = 0
+        return result
+
+def _decompile_with_process(class_file):
+    """Run CFR in a one-off JVM, returning (ok, text)"""
+    result = subprocess.run(['java', '-jar', CFR_JAR_PATH, class_file], 
+                          capture_output=True, text=True, timeout=CFR_TIMEOUT)
+    if result.returncode != 0:
+        return False, result.stderr
+    return True, result.stdout
 
 def decompile_class(class_file):
-    """Decompile Java class file using CFR"""
+    """Decompile Java class file using CFR, reusing cached output for identical class files"""
+    return _decompile_class(class_file)[1]
+
+def _decompile_class(class_file):
+    """Decompile a class file, returning (ok, source or error message)"""
     try:
+        with open(class_file, 'rb') as f:
+            key = hashlib.sha1(f.read()).hexdigest()
+        cached = _read_cfr_cache(key)
+        if cached is not None:
+            return True, cached
+        
         # Ensure CFR is downloaded
         if not os.path.exists(CFR_JAR_PATH):
             download_cfr()
         
-        # Run CFR decompiler
-        result = subprocess.run(['java', '-jar', CFR_JAR_PATH, class_file], 
-                              capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            return f"Error decompiling: {result.stderr}"
-        
-        return result.stdout
+        # Prefer the persistent worker; fall back to a JVM per file if it can't run
+        try:
+            result = _decompile_with_worker(class_file)
+        except TimeoutError as e:
+            return False, f"Error decompiling: {e}"
+        if result is None:
+            result = _decompile_with_process(class_file)
+        ok, output = result
+        
+        if not ok:
+            return False, f"Error decompiling: {output}"
+        
+        _write_cfr_cache(key, output)
+        return True, output
     except Exception as e:
-        return f"Error: {str(e)}"
+        return False, f"Error: {str(e)}"
+
+# Integer ids for the operations the simulator understands; 0 is a no-op
+(_OP_NOP, _OP_LDC, _OP_PRINTLN, _OP_APPEND, _OP_TO_STRING, _OP_NEW_STRING_BUILDER,
+ _OP_ISTORE_1, _OP_ISTORE_2, _OP_ICONST_5, _OP_BIPUSH,
+ _OP_IADD, _OP_ISUB, _OP_IMUL, _OP_IDIV, _OP_IREM) = range(15)
+
+# Opcodes whose simulation does not depend on their operands
+_OPCODE_IDS = {
+    'istore_1': _OP_ISTORE_1,
+    'istore_2': _OP_ISTORE_2,
+    'iconst_5': _OP_ICONST_5,
+    'iadd': _OP_IADD,
+    'isub': _OP_ISUB,
+    'imul': _OP_IMUL,
+    'idiv': _OP_IDIV,
+    'irem': _OP_IREM,
+}
+
+def _lower_instruction(opcode, operands):
+    """Resolve an instruction to an operation id and its pre-parsed argument"""
+    if opcode == 'ldc':
+        match = _CP_INDEX_RE.search(operands)
+        return _OP_LDC, int(match.group(1)) if match else None
+    if opcode == 'bipush':
+        try:
+            return _OP_BIPUSH, int(operands)
+        except ValueError:
+            return _OP_NOP, None
+    if opcode == 'invokevirtual':
+        if 'println' in operands:
+            return _OP_PRINTLN, None
+        if 'append' in operands:
+            return _OP_APPEND, None
+        if 'toString' in operands:
+            return _OP_TO_STRING, None
+        return _OP_NOP, None
+    if opcode == 'new' and 'java/lang/StringBuilder' in operands:
+        return _OP_NEW_STRING_BUILDER, None
+    # getstatic, loads, returns, ... need no simulation
+    return _OPCODE_IDS.get(opcode, _OP_NOP), None
+
+class Instruction:
+    """A single disassembled bytecode instruction"""
+    __slots__ = ('offset', 'opcode', 'operands', 'line', 'op_id', 'arg')
+
+    def __init__(self, offset, opcode, operands, line):
+        self.offset = offset
+        self.opcode = opcode
+        self.operands = operands
+        self.line = line  # Source line, or None if unknown
+        self.op_id, self.arg = _lower_instruction(opcode, operands)
 
 class JavaVirtualDebugger:
     def __init__(self, bytecode):
         self.bytecode = bytecode
-        self.instructions = self.parse_bytecode(bytecode)
-        self.breakpoints = []
+        self.string_constants = {}  # Store string constants from constant pool
+        self.instructions = self.parse_bytecode(bytecode)  # Single pass, also fills string_constants
+        self.offsets = [instr.offset for instr in self.instructions]  # Bytecode offset per instruction index
+        # Display text for the debug view, one line per instruction
+        self.formatted_lines = tuple(f"{instr.offset}: {instr.opcode} {instr.operands}" for instr in self.instructions)
+        self.formatted_bytecode = "\n".join(self.formatted_lines) + "\n" if self.formatted_lines else ""
+        self.breakpoints = set()  # Bytecode offsets to pause at
         self.output = []
         self.variables = {}
         self.stack = []
@@ -129,69 +694,100 @@ class JavaVirtualDebugger:
         self.execution_state = "stopped"  # Can be "stopped", "running", "paused"
         self.line_to_instruction = self._build_line_map()
         self.last_breakpoint_hit = None  # Track the last breakpoint hit
-        self.program_output = []  # Store program output
-        self.string_constants = {}  # Store string constants from constant pool
-        self.parse_constant_pool(bytecode)
+        self.program_output = deque(maxlen=PROGRAM_OUTPUT_MAX_ENTRIES)  # Store program output
+        self._output_written = 0  # Entries ever appended to program_output
+        self._output_read = 0  # Entries already returned by output_delta
+        # Operation id and argument per instruction index, for the run loop
+        self.op_ids = [instr.op_id for instr in self.instructions]
+        self.args = [instr.arg for instr in self.instructions]
+        # Instruction indexes per bytecode offset, for locating breakpoints
+        self._offset_indexes = defaultdict(list)
+        for idx, offset in enumerate(self.offsets):
+            self._offset_indexes[offset].append(idx)
+        # Handlers indexed by operation id, so dispatch is a single tuple index
+        self._handlers = (
+            None,
+            self._op_ldc,
+            self._op_println,
+            self._op_append,
+            self._op_to_string,
+            self._op_new_string_builder,
+            self._op_istore_1,
+            self._op_istore_2,
+            self._op_iconst_5,
+            self._op_bipush,
+            self._op_iadd,
+            self._op_isub,
+            self._op_imul,
+            self._op_idiv,
+            self._op_irem,
+        )
 
     def _build_line_map(self):
         """Create a mapping from source lines to instruction indexes"""
-        line_map = {}
+        line_map = defaultdict(list)
         for idx, instr in enumerate(self.instructions):
-            if instr['line'] is not None:
-                if instr['line'] not in line_map:
-                    line_map[instr['line']] = []
-                line_map[instr['line']].append(idx)
+            line = instr.line
+            if line is not None:
+                line_map[line].append(idx)
         return line_map
         
     def parse_bytecode(self, bytecode):
+        """Parse javap output into instructions, collecting constant pool strings in the same pass.
+        
+        bytecode may be the full output as a string or any iterable of lines.
+        """
         instructions = []
         current_line = None
+        in_constant_pool = False
+        # Bound once, as these run for every line of output
+        search_constant = _CONST_RE.search
+        search_instruction = _BC_RE.search
+        string_constants = self.string_constants
         
         # Simple parser for javap output
-        for line in bytecode.split('\n'):
+        for line in _iter_lines(bytecode):
+            if 'Constant pool:' in line:
+                in_constant_pool = True
+                continue
+            stripped = line.lstrip()
+            if in_constant_pool:
+                if not stripped:
+                    in_constant_pool = False
+                    continue
+                # Match string and UTF8 constants, which always start with their index
+                if stripped.startswith('#'):
+                    const_match = search_constant(line)
+                    if const_match:
+                        string_constants[int(const_match.group('index'))] = const_match.group('value')
+            
+            # Cheap prefix check so most lines never reach the regex engine:
+            # only instructions (offset first) and LineNumberTable rows can match
+            if not stripped or not (stripped[0].isdigit() or stripped.startswith('line ')):
+                continue
+            match = search_instruction(line)
+            if not match:
+                continue
+            
             # Detect line numbers
-            line_match = re.search(r"line (\d+):", line)
-            if line_match:
-                current_line = int(line_match.group(1))
+            if match.lastgroup == 'line':
+                current_line = int(match.group('line_no'))
+                continue
                 
             # Detect bytecode instructions
-            instr_match = re.search(r"^\s*(\d+): ([a-zA-Z_]+)(.*?)(?://.*)?$", line)
-            if instr_match:
-                offset = int(instr_match.group(1))
-                opcode = instr_match.group(2)
-                operands = instr_match.group(3).strip()
-                instructions.append({
-                    'offset': offset,
-                    'opcode': opcode,
-                    'operands': operands,
-                    'line': current_line
-                })
+            instructions.append(Instruction(
+                int(match.group('offset')),
+                match.group('opcode'),
+                match.group('operands').strip(),
+                current_line
+            ))
                 
         return instructions
     
     def parse_constant_pool(self, bytecode):
         """Parse constant pool entries for strings"""
-        in_constant_pool = False
-        for line in bytecode.split('\n'):
-            if 'Constant pool:' in line:
-                in_constant_pool = True
-                continue
-            if in_constant_pool:
-                if line.strip() == '':
-                    in_constant_pool = False
-                    continue
-                # Match string constants
-                string_match = re.search(r'#\d+\s+=\s+String\s+#\d+\s+//\s+(.+)$', line)
-                if string_match:
-                    string_value = string_match.group(1)
-                    index = int(re.search(r'#(\d+)', line).group(1))
-                    self.string_constants[index] = string_value
-                # Match UTF8 constants
-                utf8_match = re.search(r'#\d+\s+=\s+Utf8\s+(.+)$', line)
-                if utf8_match:
-                    string_value = utf8_match.group(1)
-                    index = int(re.search(r'#(\d+)', line).group(1))
-                    self.string_constants[index] = string_value
+        # parse_bytecode fills string_constants as it goes
+        self.parse_bytecode(bytecode)
 
     def reset(self):
         """Reset execution state"""
@@ -201,7 +797,9 @@ class JavaVirtualDebugger:
         self.current_instruction_index = 0
         self.execution_state = "stopped"
         self.output.append("Program reset. Ready to run.")
-        self.program_output = []  # Clear program output
+        self.program_output = deque(maxlen=PROGRAM_OUTPUT_MAX_ENTRIES)  # Clear program output
+        self._output_written = 0
+        self._output_read = 0
         return "\n".join(self.output)
     
     def step(self):
@@ -215,15 +813,15 @@ class JavaVirtualDebugger:
         
         # Get the current instruction
         instr = self.instructions[self.current_instruction_index]
-        current_offset = instr['offset']
+        current_offset = instr.offset
         
         # Clear the output list for a cleaner display
         self.output = []
         
         # Show the instruction being executed
-        self.output.append(f"Executing: {current_offset}: {instr['opcode']} {instr['operands']}")
-        if instr['line'] is not None:
-            self.output.append(f"Source line: {instr['line']}")
+        self.output.append(f"Executing: {current_offset}: {instr.opcode} {instr.operands}")
+        if instr.line is not None:
+            self.output.append(f"Source line: {instr.line}")
         
         # Simulate execution of this instruction
         self._simulate_instruction(instr)
@@ -238,106 +836,108 @@ class JavaVirtualDebugger:
     
     def _simulate_instruction(self, instr):
         """Simulate the execution of an instruction"""
-        opcode = instr['opcode']
-        operands = instr['operands']
-        
-        if opcode == 'ldc':
-            # Load constant from constant pool
-            const_index = int(re.search(r'#(\d+)', operands).group(1))
-            if const_index in self.string_constants:
-                self.stack.append(self.string_constants[const_index])
-                self.output.append(f"Loaded string constant: {self.string_constants[const_index]}")
-            else:
-                try:
-                    # Try to parse as number if it's not a string
-                    value = float(operands.strip())
-                    self.stack.append(value)
-                    self.output.append(f"Loaded constant: {value}")
-                except:
-                    self.stack.append(None)
-        elif opcode == 'getstatic' and 'java/lang/System.out' in operands:
-            # System.out reference - no action needed
-            pass
-        elif opcode == 'invokevirtual':
-            if 'println' in operands:
-                # Handle different println overloads
-                if len(self.stack) >= 1:
-                    value = self.stack.pop()
-                    output_str = str(value)
-                    self.output.append(f"Program output: {output_str}")
-                    self.program_output.append(f"{output_str}\n")
-            elif 'append' in operands:
-                # Handle StringBuilder append
-                if len(self.stack) >= 2:
-                    value = self.stack.pop()
-                    builder = self.stack.pop()
-                    result = str(builder) + str(value)
-                    self.stack.append(result)
-                    self.output.append(f"Appended: {value} to {builder}")
-            elif 'toString' in operands:
-                # Handle toString calls
-                if len(self.stack) >= 1:
-                    value = self.stack.pop()
-                    result = str(value)
-                    self.stack.append(result)
-                    self.output.append(f"Converted to string: {result}")
-        elif opcode == 'new' and 'java/lang/StringBuilder' in operands:
-            # Initialize new StringBuilder
-            self.stack.append("")
-            self.output.append("Created new StringBuilder")
+        self._simulate_int(instr.op_id, instr.arg)
+    
+    def _simulate_int(self, op_id, arg):
+        """Simulate an operation given its id and pre-parsed argument"""
+        if op_id:
+            self._handlers[op_id](arg)
+    
+    def _op_ldc(self, const_index):
+        # Load constant from constant pool
+        if const_index in self.string_constants:
+            self.stack.append(self.string_constants[const_index])
+            self.output.append(f"Loaded string constant: {self.string_constants[const_index]}")
         else:
-            # Handle other numeric operations
-            # ...existing numeric operation handling...
-            if opcode == 'istore_1':
-                # Store top of stack to local variable 1
-                if self.stack:
-                    self.variables["a"] = self.stack.pop()
-                    self.output.append(f"Set variable 'a' = {self.variables['a']}")
-            elif opcode == 'istore_2':
-                # Store top of stack to local variable 2
-                if self.stack:
-                    self.variables["b"] = self.stack.pop()
-                    self.output.append(f"Set variable 'b' = {self.variables['b']}")
-            elif opcode == 'iconst_5':
-                # Push constant 5 to stack
-                self.stack.append(5)
-                self.output.append("Pushed constant 5 to stack")
-            elif opcode == 'bipush':
-                # Push byte constant
-                value = int(operands.strip())
-                self.stack.append(value)
-                self.output.append(f"Pushed constant {value} to stack")
-            elif opcode == 'iadd':
-                # Add top two stack values
-                if len(self.stack) >= 2:
-                    b = self.stack.pop()
-                    a = self.stack.pop()
-                    result = a + b
-                    self.stack.append(result)
-                    self.output.append(f"Added {a} + {b} = {result}")
-            elif opcode == 'isub':
-                # Subtract top two stack values
-                if len(self.stack) >= 2:
-                    b = self.stack.pop()
-                    a = self.stack.pop()
-                    result = a - b
-                    self.stack.append(result)
-                    self.output.append(f"Subtracted {a} - {b} = {result}")
-            elif opcode in ['imul', 'idiv', 'irem']:
-                # Other operations
-                if len(self.stack) >= 2:
-                    b = self.stack.pop()
-                    a = self.stack.pop()
-                    if opcode == 'imul':
-                        result = a * b
-                        self.output.append(f"Multiplied {a} * {b} = {result}")
-                    elif opcode == 'idiv':
-                        result = a // b
-                        self.output.append(f"Divided {a} / {b} = {result}")
-                    elif opcode == 'irem':
-                        result = a % b
-                        self.output.append(f"Remainder {a} % {b} = {result}")
-                    self.stack.append(result)
+            self.stack.append(None)
+    
+    def _op_println(self, arg):
+        # Handle different println overloads
+        if len(self.stack) >= 1:
+            value = self.stack.pop()
+            output_str = str(value)
+            self.output.append(f"Program output: {output_str}")
+            self.program_output.append(f"{output_str}\n")
+            self._output_written += 1
+    
+    def _op_append(self, arg):
+        # Handle StringBuilder append
+        if len(self.stack) >= 2:
+            value = self.stack.pop()
+            builder = self.stack.pop()
+            result = str(builder) + str(value)
+            self.stack.append(result)
+            self.output.append(f"Appended: {value} to {builder}")
+    
+    def _op_to_string(self, arg):
+        # Handle toString calls
+        if len(self.stack) >= 1:
+            value = self.stack.pop()
+            result = str(value)
+            self.stack.append(result)
+            self.output.append(f"Converted to string: {result}")
+    
+    def _op_new_string_builder(self, arg):
+        # Initialize new StringBuilder
+        self.stack.append("")
+        self.output.append("Created new StringBuilder")
+    
+    def _op_istore_1(self, arg):
+        # Store top of stack to local variable 1
+        if self.stack:
+            self.variables["a"] = self.stack.pop()
+            self.output.append(f"Set variable 'a' = {self.variables['a']}")
+    
+    def _op_istore_2(self, arg):
+        # Store top of stack to local variable 2
+        if self.stack:
+            self.variables["b"] = self.stack.pop()
+            self.output.append(f"Set variable 'b' = {self.variables['b']}")
+    
+    def _op_iconst_5(self, arg):
+        # Push constant 5 to stack
+        self.stack.append(5)
+        self.output.append("Pushed constant 5 to stack")
+    
+    def _op_bipush(self, value):
+        # Push byte constant
+        self.stack.append(value)
+        self.output.append(f"Pushed constant {value} to stack")
+    
+    def _op_iadd(self, arg):
+        # Add top two stack values
+        self._binary_op(operator.add, "Added {a} + {b} = {result}")
+    
+    def _op_isub(self, arg):
+        # Subtract top two stack values
+        self._binary_op(operator.sub, "Subtracted {a} - {b} = {result}")
+    
+    def _op_imul(self, arg):
+        self._binary_op(operator.mul, "Multiplied {a} * {b} = {result}")
+    
+    def _op_idiv(self, arg):
+        self._binary_op(operator.floordiv, "Divided {a} / {b} = {result}")
+    
+    def _op_irem(self, arg):
+        self._binary_op(operator.mod, "Remainder {a} % {b} = {result}")
+    
+    def _binary_op(self, op, message):
+        """Replace the top two stack values with op(a, b)"""
+        stack = self.stack
+        if len(stack) < 2:
+            return
+        b = stack.pop()
+        a = stack.pop()
+        result = op(a, b)
+        stack.append(result)
+        self.output.append(message.format(a=a, b=b, result=result))
+    
+    def output_delta(self):
+        """Return the program output written since the last call, as one string"""
+        new = min(self._output_written - self._output_read, len(self.program_output))
+        self._output_read = self._output_written
+        # Take the newest entries from the right end of the deque
+        return "".join(reversed(list(itertools.islice(reversed(self.program_output), new))))
     
     def _show_state(self):
         """Show the current program state"""
@@ -354,39 +954,62 @@ class JavaVirtualDebugger:
         self.output.append("")  # Empty line for readability
     
     def run_to_next_breakpoint(self):
-        """Run execution until next breakpoint is hit or program ends"""
+        """Run execution until next breakpoint is hit or program ends.
+        
+        Only debugger state changes here; callers refresh their views once it returns.
+        """
         self.execution_state = "running"
         self.output = []
         
-        # Skip the current breakpoint if we're already on it
-        skip_current = False
-        if self.current_instruction_index < len(self.instructions):
-            current_offset = self.instructions[self.current_instruction_index]['offset']
-            if current_offset in self.breakpoints and current_offset == self.last_breakpoint_hit:
-                skip_current = True
-        
-        while self.current_instruction_index < len(self.instructions):
-            current_instr = self.instructions[self.current_instruction_index]
-            current_offset = current_instr['offset']
-            
-            # Check if this instruction is at a breakpoint
-            if current_offset in self.breakpoints and (not skip_current or current_offset != self.last_breakpoint_hit):
-                self.execution_state = "paused"
-                self.last_breakpoint_hit = current_offset
-                self._show_state()
-                return "\n".join(self.output)
-            
-            # After processing the first instruction, we're past any skipped breakpoint
-            skip_current = False
-            
-            # Simulate execution (minimal output during run to breakpoint)
-            self._simulate_instruction(current_instr)
-            self.current_instruction_index += 1
+        offsets = self.offsets
+        count = len(offsets)
+        start = self.current_instruction_index
         
-        self.execution_state = "stopped"
+        # Skip the current breakpoint if we're already on it
+        search_from = start
+        if start < count and offsets[start] in self.breakpoints and offsets[start] == self.last_breakpoint_hit:
+            search_from = start + 1
+        stop = self._next_breakpoint_index(search_from)
+        
+        # Simulate execution (minimal output during run to breakpoint)
+        if start < stop:
+            self._run_segment(start, stop)
+        self.current_instruction_index = max(start, stop)
+        
+        if stop < count:
+            self.execution_state = "paused"
+            self.last_breakpoint_hit = offsets[stop]
+        else:
+            self.execution_state = "stopped"
         self._show_state()
         return "\n".join(self.output)
     
+    def _next_breakpoint_index(self, from_index):
+        """Find the first instruction index at or after from_index that is on a breakpoint"""
+        next_index = len(self.offsets)
+        for offset in self.breakpoints:
+            indexes = self._offset_indexes.get(offset)
+            if indexes:
+                pos = bisect.bisect_left(indexes, from_index)
+                if pos < len(indexes) and indexes[pos] < next_index:
+                    next_index = indexes[pos]
+        return next_index
+    
+    def _run_segment(self, start, stop):
+        """Execute instructions start..stop-1 by dispatching on their operation ids"""
+        op_ids = self.op_ids
+        args = self.args
+        handlers = self._handlers
+        for idx in range(start, stop):
+            op_id = op_ids[idx]
+            if op_id:
+                try:
+                    handlers[op_id](args[idx])
+                except Exception:
+                    # Leave the program counter on the failing instruction, like step() does
+                    self.current_instruction_index = idx
+                    raise
+    
     def run_to_breakpoint(self):
         # For backward compatibility
         return self.run_to_next_breakpoint()
@@ -398,14 +1021,54 @@ class JavaVirtualDebugger:
     def get_current_line(self):
         """Get the current source line number for highlighting"""
         if self.current_instruction_index < len(self.instructions):
-            return self.instructions[self.current_instruction_index].get('line')
+            return self.instructions[self.current_instruction_index].line
         return None
 
+# 16x16 tree icons, drawn as filled (color, (x1, y1, x2, y2)) rectangles
+_ICON_SHAPES = {
+    'folder': [('#d9a43a', (1, 2, 7, 4)), ('#e8b84a', (1, 4, 15, 14))],
+    'project': [('#3f7fc4', (1, 2, 7, 4)), ('#4a90d9', (1, 4, 15, 14))],
+    'class': [('#6f4420', (3, 4, 12, 14)), ('#8b5a2b', (4, 5, 11, 13)), ('#6f4420', (12, 6, 14, 11))],
+    'source': [('#808080', (3, 1, 13, 15)), ('#ffffff', (4, 2, 12, 14)),
+               ('#808080', (5, 5, 11, 6)), ('#808080', (5, 8, 11, 9)), ('#808080', (5, 11, 9, 12))],
+    'archive': [('#8c7a5b', (2, 3, 14, 14)), ('#b8a27a', (3, 4, 13, 13)), ('#8c7a5b', (7, 3, 9, 14))],
+}
+
+def _name_key(entry):
+    """Sort key for (name, path) directory entries"""
+    return entry[0].lower()
+
+def _make_icon(master, shapes):
+    """Draw a tree icon from a list of filled rectangles"""
+    image = tk.PhotoImage(master=master, width=16, height=16)
+    for color, box in shapes:
+        image.put(color, to=box)
+    return image
+
+def load_class_file(class_file):
+    """Disassemble, decompile and build a debugger for a class file.
+    
+    Successful tool output is reused for as long as the file's modification time
+    and size are unchanged.
+    """
+    st = os.stat(class_file)
+    key = (os.path.abspath(class_file), st.st_mtime_ns, st.st_size)
+    disassembled_code = _memoized_output(_cached_disassembly, key)
+    decompiled_code = _memoized_output(_cached_decompilation, key)
+    return disassembled_code, decompiled_code, JavaVirtualDebugger(disassembled_code)
+
 class ProjectExplorer(ttk.Frame):
+    # Shared pool for analyzing class files in parallel
+    _analysis_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    
     def __init__(self, parent, callback):
         super().__init__(parent)
         self.callback = callback
-        self.class_references: Dict[str, Set[str]] = {}  # Store class dependencies
+        self.class_references: Dict[str, Set[str]] = {}  # Store class dependencies, by class file path
+        self.class_names: Dict[str, str] = {}  # Internal name of each analyzed class file, by path
+        self._reference_stamps: Dict[str, tuple] = {}  # (mtime_ns, size) of each file when it was analyzed
+        # Icons are created once and shared by every tree row
+        self.icons = {name: _make_icon(self, shapes) for name, shapes in _ICON_SHAPES.items()}
         
         # Create navigation frame
         self.nav_frame = ttk.Frame(self)
@@ -467,12 +1130,11 @@ class ProjectExplorer(ttk.Frame):
             self.current_index = len(self.history) - 1
         
         try:
-            entries = os.listdir(path)
-            
             # Add parent directory entry if not at root
             parent_path = os.path.dirname(path)
             if parent_path != path:  # Not at root
-                self.tree.insert('', 0, text="📂 ..", values=('Directory', parent_path), tags=('parent',))
+                self.tree.insert('', 0, text="..", image=self.icons['folder'],
+                               values=('Directory', parent_path), tags=('parent',))
             
             # Group entries by type
             dirs = []
@@ -480,38 +1142,39 @@ class ProjectExplorer(ttk.Frame):
             java_files = []
             other_files = []
             
-            for entry in entries:
-                full_path = os.path.join(path, entry)
-                if os.path.isdir(full_path):
-                    if not entry.startswith('.'):
-                        dirs.append((entry, full_path))
-                elif entry.endswith('.class'):
-                    class_files.append((entry, full_path))
-                elif entry.endswith('.java'):
-                    java_files.append((entry, full_path))
-                elif entry.endswith(('.jar', '.war', '.ear')):
-                    other_files.append((entry, full_path))
+            # scandir entries carry their file type, so classifying needs no extra stat calls
+            with os.scandir(path) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir():
+                        if not name.startswith('.'):
+                            dirs.append((name, entry.path))
+                    elif name.endswith('.class'):
+                        class_files.append((name, entry.path))
+                    elif name.endswith('.java'):
+                        java_files.append((name, entry.path))
+                    elif name.endswith(('.jar', '.war', '.ear')):
+                        other_files.append((name, entry.path))
             
             # Add directories first
-            for name, full_path in sorted(dirs):
-                icon = '📂' if name in ['src', 'bin', 'build', 'target'] else '📁'
-                self.tree.insert('', 'end', text=f"{icon} {name}", 
+            for name, full_path in sorted(dirs, key=_name_key):
+                icon = self.icons['project' if name in ['src', 'bin', 'build', 'target'] else 'folder']
+                self.tree.insert('', 'end', text=name, image=icon,
                                values=('Directory', full_path))
             
             # Add class files
-            for name, full_path in sorted(class_files):
-                self.tree.insert('', 'end', text=f"☕ {name}", 
+            for name, full_path in sorted(class_files, key=_name_key):
+                self.tree.insert('', 'end', text=name, image=self.icons['class'],
                                values=('Class', full_path))
-                self.analyze_class_file(full_path)
             
             # Add Java source files
-            for name, full_path in sorted(java_files):
-                self.tree.insert('', 'end', text=f"📝 {name}", 
+            for name, full_path in sorted(java_files, key=_name_key):
+                self.tree.insert('', 'end', text=name, image=self.icons['source'],
                                values=('Source', full_path))
             
             # Add other Java-related files
-            for name, full_path in sorted(other_files):
-                self.tree.insert('', 'end', text=f"📦 {name}", 
+            for name, full_path in sorted(other_files, key=_name_key):
+                self.tree.insert('', 'end', text=name, image=self.icons['archive'],
                                values=('Archive', full_path))
             
         except Exception as e:
@@ -520,21 +1183,32 @@ class ProjectExplorer(ttk.Frame):
         self.update_nav_buttons()
     
     def analyze_class_file(self, class_file):
-        """Analyze a class file for dependencies"""
+        """Analyze a class file for dependencies, unless it is unchanged since the last analysis"""
+        path = os.path.abspath(class_file)
         try:
-            output = disassemble_class(class_file)
-            # Find references to other classes
-            refs = set()
-            for line in output.split('\n'):
-                # Look for class references in constant pool
-                if 'Class' in line and 'java/lang' not in line:
-                    match = re.search(r'Class\s+(.+?)[\s/]', line)
-                    if match:
-                        refs.add(match.group(1))
-            self.class_references[os.path.basename(class_file)] = refs
+            st = os.stat(path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            if self._reference_stamps.get(path) == stamp:
+                return
+            self.class_names[path], self.class_references[path] = read_class_references(path)
+            self._reference_stamps[path] = stamp
         except Exception as e:
             print(f"Error analyzing {class_file}: {e}")
     
+    def _ensure_analyzed(self, class_files):
+        """Analyze the given class files that are new or changed"""
+        # Each analysis only reads one file, so spread them over the pool
+        list(self._analysis_pool.map(self.analyze_class_file, class_files))
+    
+    def _directory_class_files(self):
+        """Paths of the class files listed in the current directory"""
+        paths = []
+        for item in self.tree.get_children():
+            values = self.tree.item(item)['values']
+            if values[0] == 'Class':
+                paths.append(values[1])
+        return paths
+    
     def show_dependencies(self):
         """Show dependencies of selected class file"""
         selection = self.tree.selection()
@@ -546,8 +1220,11 @@ class ProjectExplorer(ttk.Frame):
         if item_type != 'Class':
             return
         
-        class_name = os.path.basename(self.tree.item(item)['values'][1])
-        if class_name not in self.class_references:
+        class_file = os.path.abspath(self.tree.item(item)['values'][1])
+        class_name = os.path.basename(class_file)
+        # Classes are analyzed on demand and memoized in class_references
+        self._ensure_analyzed([class_file])
+        if class_file not in self.class_references:
             return
         
         # Create dependencies window
@@ -563,7 +1240,7 @@ class ProjectExplorer(ttk.Frame):
         ttk.Label(deps_frame, text="References:").pack(anchor=W)
         refs_text = scrolledtext.ScrolledText(deps_frame, height=5)
         refs_text.pack(fill=BOTH, expand=True)
-        for ref in sorted(self.class_references[class_name]):
+        for ref in sorted(self.class_references[class_file]):
             refs_text.insert(END, f"• {ref}\n")
         refs_text.config(state=DISABLED)
         
@@ -571,9 +1248,12 @@ class ProjectExplorer(ttk.Frame):
         ttk.Label(deps_frame, text="Referenced by:").pack(anchor=W)
         refs_by_text = scrolledtext.ScrolledText(deps_frame, height=5)
         refs_by_text.pack(fill=BOTH, expand=True)
-        for other_class, refs in self.class_references.items():
-            if class_name.replace('.class', '') in refs:
-                refs_by_text.insert(END, f"• {other_class}\n")
+        # Only classes in the directory being shown count
+        directory_class_files = [os.path.abspath(path) for path in self._directory_class_files()]
+        self._ensure_analyzed(directory_class_files)
+        for other_file in directory_class_files:
+            if self.class_names[class_file] in self.class_references.get(other_file, ()):
+                refs_by_text.insert(END, f"• {os.path.basename(other_file)}\n")
         refs_by_text.config(state=DISABLED)
     
     def on_select(self, event):
@@ -676,6 +1356,85 @@ class DecompilerApp:
         self.debugger_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.debugger_frame, text="Debug View")
         
+        # Tab contents are built the first time each tab is shown
+        self.debug_bytecode_text = None
+        self.debug_line_numbers = None
+        self.console_text = None
+        self.program_output_text = None
+        self.disasm_text = None
+        self.disasm_line_numbers = None
+        self.decompiled_text = None
+        self.decompiled_line_numbers = None
+        self._tab_builders = {
+            str(self.disasm_frame): self._build_disasm_tab,
+            str(self.decompiled_frame): self._build_decompiled_tab,
+            str(self.debugger_frame): self._build_debug_tab,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
+        # Status bar with updated legend
+        self.status_frame = ttk.Frame(root)
+        self.status_frame.pack(side=BOTTOM, fill=X)
+        
+        self.status_var = tk.StringVar()
+        self.status_var.set("Double-click a .class file to decompile and debug")
+        self.status_bar = ttk.Label(
+            self.status_frame, 
+            textvariable=self.status_var, 
+            relief=SUNKEN, 
+            anchor=W
+        )
+        self.status_bar.pack(side=LEFT, fill=X, expand=True)
+        
+        # Updated legend, using the explorer's tree icons
+        self.legend_frame = ttk.Frame(self.status_frame)
+        self.legend_frame.pack(side=RIGHT)
+        icons = self.file_explorer.icons
+        for icon, text in (('folder', "Folder"), ('project', "Project"),
+                           ('class', "Class (double-click to open)"), ('source', "Source")):
+            ttk.Label(
+                self.legend_frame,
+                text=text,
+                image=icons[icon],
+                compound=LEFT,
+                padding=(5, 0)
+            ).pack(side=LEFT)
+        
+        # Store the current class file
+        self.current_class_file = None
+        self.debugger = None
+        self._current_future = None  # Load job of the most recently opened file
+        # Latest content for the text tabs, applied when a tab is built
+        self._disassembled_code = ""
+        self._decompiled_code = ""
+        self.last_highlight = None  # Track the last highlighted line
+        self._pending_highlight = False  # A highlight update is queued for the next idle moment
+        # Debug view line numbers, built with the formatted bytecode in _fill_debug_view
+        self._line_to_offset: Dict[int, int] = {}
+        self._bytecode_line_count = 0  # Lines in the debug bytecode view
+        # What the console widget already shows, for incremental updates
+        self._console_content = ""
+        # Text last put in each code view by _set_text
+        self._shown_text = {}
+        
+        # Check for Java
+        if not java_available():
+            messagebox.showerror("Error", "Java is not installed or not in PATH")
+            root.destroy()
+            return
+        
+        # Build whichever tab is shown first
+        self._on_tab_changed()
+    
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab's widgets if it is being shown for the first time"""
+        tab = self.notebook.select()
+        builder = self._tab_builders.get(tab)
+        if builder is not None:
+            self._tab_builders[tab] = None
+            builder()
+    
+    def _build_debug_tab(self):
         # Set up the debugger view with a horizontal paned window
         self.debug_pane = ttk.PanedWindow(self.debugger_frame, orient=HORIZONTAL)
         self.debug_pane.pack(fill=BOTH, expand=True)
@@ -691,7 +1450,9 @@ class DecompilerApp:
         self.debug_bytecode_text = scrolledtext.ScrolledText(
             self.debug_bytecode_container, 
             wrap=NONE, 
-            font=self.code_font
+            font=self.code_font,
+            undo=False,
+            state=DISABLED
         )
         self.debug_bytecode_text.pack(side=RIGHT, fill=BOTH, expand=True)
         
@@ -730,7 +1491,9 @@ class DecompilerApp:
             self.debug_console_frame, 
             wrap=WORD,
             font=self.code_font,
-            height=10
+            height=10,
+            undo=False,
+            state=DISABLED
         )
         self.console_text.pack(fill=BOTH, expand=True, padx=5, pady=5)
         
@@ -743,13 +1506,19 @@ class DecompilerApp:
             self.debug_console_frame, 
             wrap=WORD,
             font=self.code_font,
-            height=10
+            height=10,
+            undo=False,
+            state=DISABLED
         )
         self.program_output_text.pack(fill=BOTH, expand=True, padx=5, pady=5)
         
         # Highlight tags
         self.debug_bytecode_text.tag_configure("current_line", background="#ffff99")
         
+        if self.debugger:
+            self._fill_debug_view()
+    
+    def _build_disasm_tab(self):
         # Set up the disassembly view
         self.disasm_container = ttk.Frame(self.disasm_frame)
         self.disasm_container.pack(fill=BOTH, expand=True)
@@ -757,7 +1526,9 @@ class DecompilerApp:
         self.disasm_text = scrolledtext.ScrolledText(
             self.disasm_container, 
             wrap=NONE,
-            font=self.code_font
+            font=self.code_font,
+            undo=False,
+            state=DISABLED
         )
         self.disasm_text.pack(side=RIGHT, fill=BOTH, expand=True)
         
@@ -768,7 +1539,9 @@ class DecompilerApp:
             background='#f0f0f0'
         )
         self.disasm_line_numbers.pack(side=LEFT, fill=Y)
-        
+        self._set_text(self.disasm_text, self._disassembled_code)
+    
+    def _build_decompiled_tab(self):
         # Set up the decompiled view
         self.decompiled_container = ttk.Frame(self.decompiled_frame)
         self.decompiled_container.pack(fill=BOTH, expand=True)
@@ -776,7 +1549,9 @@ class DecompilerApp:
         self.decompiled_text = scrolledtext.ScrolledText(
             self.decompiled_container, 
             wrap=NONE,
-            font=self.code_font
+            font=self.code_font,
+            undo=False,
+            state=DISABLED
         )
         self.decompiled_text.pack(side=RIGHT, fill=BOTH, expand=True)
         
@@ -787,45 +1562,11 @@ class DecompilerApp:
             background='#f0f0f0'
         )
         self.decompiled_line_numbers.pack(side=LEFT, fill=Y)
-        
-        # Status bar with updated legend
-        self.status_frame = ttk.Frame(root)
-        self.status_frame.pack(side=BOTTOM, fill=X)
-        
-        self.status_var = tk.StringVar()
-        self.status_var.set("Double-click a .class file to decompile and debug")
-        self.status_bar = ttk.Label(
-            self.status_frame, 
-            textvariable=self.status_var, 
-            relief=SUNKEN, 
-            anchor=W
-        )
-        self.status_bar.pack(side=LEFT, fill=X, expand=True)
-        
-        # Updated legend
-        self.legend_label = ttk.Label(
-            self.status_frame,
-            text="📁 Folder  📂 Project  ☕ Class (double-click to open)  📝 Source",
-            padding=(5, 0)
-        )
-        self.legend_label.pack(side=RIGHT)
-        
-        # Store the current class file
-        self.current_class_file = None
-        self.debugger = None
-        self.last_highlight = None  # Track the last highlighted line
-        
-        # Check for Java
-        try:
-            subprocess.run(['java', '-version'], capture_output=True)
-        except:
-            messagebox.showerror("Error", "Java is not installed or not in PATH")
-            root.destroy()
+        self._set_text(self.decompiled_text, self._decompiled_code)
     
     def reset_debugger(self):
         if not self.debugger:
-            self.console_text.delete(1.0, END)
-            self.console_text.insert(END, "No bytecode loaded. Please open a class file first.")
+            self.update_console("No bytecode loaded. Please open a class file first.")
             return
             
         output = self.debugger.reset()
@@ -835,69 +1576,75 @@ class DecompilerApp:
         self.debugger.last_breakpoint_hit = None
         
         # Clear highlighting
-        if self.last_highlight:
-            self.debug_bytecode_text.tag_remove("current_line", self.last_highlight, f"{self.last_highlight}+1line")
-            self.last_highlight = None
+        self._clear_highlight()
         
         # Clear program output
-        self.program_output_text.delete(1.0, END)
+        self._clear_output(self.program_output_text)
     
     def step_execution(self):
         if not self.debugger:
-            self.console_text.delete(1.0, END)
-            self.console_text.insert(END, "No bytecode loaded. Please open a class file first.")
+            self.update_console("No bytecode loaded. Please open a class file first.")
             return
         
         output = self.debugger.step()
         self.update_console(output)
         
         # Update highlighting for current instruction
-        self.highlight_current_instruction()
+        self.schedule_highlight()
         
         # Update program output
         self.update_program_output()
     
+    def schedule_highlight(self):
+        """Highlight the current instruction once Tk is idle, collapsing rapid steps into one update"""
+        if not self._pending_highlight:
+            self._pending_highlight = True
+            self.root.after_idle(self._do_highlight)
+    
+    def _do_highlight(self):
+        self._pending_highlight = False
+        if self.debugger:
+            self.highlight_current_instruction()
+    
     def highlight_current_instruction(self):
         """Highlight the current instruction in the bytecode view"""
-        # Remove previous highlighting
-        if self.last_highlight:
-            self.debug_bytecode_text.tag_remove("current_line", self.last_highlight, f"{self.last_highlight}+1line")
-        
         current_idx = self.debugger.get_current_instruction_index()
-        if current_idx is not None and current_idx < len(self.debugger.instructions):
-            # Find the line in the text widget that corresponds to this instruction
-            for line_num in range(1, int(self.debug_bytecode_text.index('end').split('.')[0])):
-                line_text = self.debug_bytecode_text.get(f"{line_num}.0", f"{line_num}.end")
-                instr_offset = self.debugger.instructions[current_idx]['offset']
-                
-                if line_text.strip().startswith(f"{instr_offset}:"):
-                    self.debug_bytecode_text.tag_add("current_line", f"{line_num}.0", f"{line_num}.end")
-                    self.debug_bytecode_text.see(f"{line_num}.0")  # Ensure the line is visible
-                    self.last_highlight = f"{line_num}.0"
-                    break
+        if current_idx is not None and current_idx < self._bytecode_line_count:
+            # Line N of the debug view shows instruction N-1
+            line_num = current_idx + 1
+            target = f"{line_num}.0"
+            if target == self.last_highlight:
+                return  # Already highlighted
+            self._clear_highlight()
+            self.debug_bytecode_text.mark_set("pc_mark", target)
+            self.debug_bytecode_text.tag_add("current_line", "pc_mark linestart", "pc_mark lineend")
+            # Only scroll when the line is off screen, sparing a redraw
+            if self.debug_bytecode_text.bbox("pc_mark") is None:
+                self.debug_bytecode_text.see("pc_mark")
+            self.last_highlight = target
+        else:
+            self._clear_highlight()
+    
+    def _clear_highlight(self):
+        """Remove the highlight from the line at pc_mark"""
+        if self.last_highlight:
+            self.debug_bytecode_text.tag_remove("current_line", "pc_mark linestart", "pc_mark lineend")
+            self.last_highlight = None
     
     def run_to_breakpoint(self):
         if not self.debugger:
-            self.console_text.delete(1.0, END)
-            self.console_text.insert(END, "No bytecode loaded. Please open a class file first.")
+            self.update_console("No bytecode loaded. Please open a class file first.")
             return
             
         # Get breakpoints from the line number widget
         breakpoints = self.debug_line_numbers.get_breakpoints()
         if not breakpoints:
-            self.console_text.delete(1.0, END)
-            self.console_text.insert(END, "No breakpoints set. Click on the line numbers to set breakpoints.")
+            self.update_console("No breakpoints set. Click on the line numbers to set breakpoints.")
             return
             
         # Convert line numbers to bytecode offsets
-        bytecode_breakpoints = []
-        for line in breakpoints:
-            line_text = self.debug_bytecode_text.get(f"{line}.0", f"{line}.end")
-            offset_match = re.match(r'^\s*(\d+):', line_text)
-            if offset_match:
-                bytecode_breakpoints.append(int(offset_match.group(1)))
-        
-        self.debugger.breakpoints = bytecode_breakpoints
+        self.debugger.breakpoints = {self._line_to_offset[line] for line in breakpoints
+                                     if line in self._line_to_offset}
         
         # Run the simulation
         self.status_var.set("Running to next breakpoint...")
@@ -909,7 +1656,7 @@ class DecompilerApp:
     
     def update_console_and_highlight(self, output):
         self.update_console(output)
-        self.highlight_current_instruction()
+        self.schedule_highlight()
         
         if self.debugger.execution_state == "stopped":
             self.status_var.set("Program execution completed")
@@ -917,75 +1664,134 @@ class DecompilerApp:
             self.status_var.set("Paused at breakpoint")
     
     def update_console(self, output):
-        self.console_text.delete(1.0, END)
-        self.console_text.insert(END, output)
+        if output.startswith(self._console_content):
+            # Output only grew, so append just the new part
+            self._append_output(self.console_text, output[len(self._console_content):])
+        else:
+            self._clear_output(self.console_text)
+            self._append_output(self.console_text, output)
+        self._console_content = output
         self.console_text.see(END)  # Scroll to the end
     
     def update_program_output(self):
-        self.program_output_text.delete(1.0, END)
-        self.program_output_text.insert(END, "".join(self.debugger.program_output))
-        self.program_output_text.see(END)  # Scroll to the end
+        new_output = self.debugger.output_delta()
+        if new_output:
+            self._append_output(self.program_output_text, new_output)
+            self.program_output_text.see(END)  # Scroll to the end
+    
+    def _set_text(self, widget, text):
+        """Show text in a code view, rewriting only the lines from the first change on"""
+        old = self._shown_text.get(widget)
+        if old == text:
+            return  # Reopened the same content
+        start = 0
+        if old:
+            # Keep every line before the first differing character
+            start = text.rfind('\n', 0, _common_prefix_length(old, text)) + 1
+        first_changed_line = text.count('\n', 0, start) + 1
+        # The views are read-only, so editing is only enabled for the update
+        widget.configure(state=NORMAL)
+        widget.mark_set("insert", "1.0")
+        # Stop short of the final newline: deleting whole lines through "end"
+        # would also take the newline ending the last kept line
+        widget.delete(f"{first_changed_line}.0", "end-1c")
+        widget.insert(END, text[start:])
+        widget.configure(state=DISABLED)
+        self._shown_text[widget] = text
+    
+    def _append_output(self, widget, text):
+        """Append to a read-only output pane, dropping the oldest lines beyond OUTPUT_MAX_LINES"""
+        widget.configure(state=NORMAL)
+        widget.insert(END, text)
+        excess = int(widget.index('end-1c').split('.')[0]) - OUTPUT_MAX_LINES
+        if excess > 0:
+            widget.delete(1.0, f"{excess + 1}.0")
+        widget.configure(state=DISABLED)
+    
+    def _clear_output(self, widget):
+        widget.configure(state=NORMAL)
+        widget.delete(1.0, END)
+        widget.configure(state=DISABLED)
     
     def open_class_file(self, class_file):
         """Open a class file from the explorer"""
         self.current_class_file = class_file
+        # Loading happens on the worker pool, so the status repaints on the next idle pass
         self.status_var.set(f"Processing: {os.path.basename(class_file)}")
-        self.root.update_idletasks()
         
-        # Clear existing breakpoints in all views
-        self.debug_line_numbers.breakpoints.clear()
-        self.disasm_line_numbers.breakpoints.clear()
-        self.decompiled_line_numbers.breakpoints.clear()
+        # Forget the line maps of the previous file
+        self._line_to_offset = {}
+        self._bytecode_line_count = 0
         
-        # Force redraw of line number canvases
-        self.debug_line_numbers.redraw()
-        self.disasm_line_numbers.redraw()
-        self.decompiled_line_numbers.redraw()
+        # Clear existing breakpoints in all views that have been built
+        for line_numbers in (self.debug_line_numbers, self.disasm_line_numbers, self.decompiled_line_numbers):
+            if line_numbers is not None:
+                line_numbers.breakpoints.clear()
+                line_numbers.schedule_redraw()
         
-        def process_file():
-            try:
-                disassembled_code = disassemble_class(class_file)
-                decompiled_code = decompile_class(class_file)
-                self.debugger = JavaVirtualDebugger(disassembled_code)
-                self.debugger.breakpoints = []  # Reset debugger breakpoints
-                self.root.after(0, lambda: self.update_ui(disassembled_code, decompiled_code))
-                self.status_var.set(f"Loaded: {os.path.basename(class_file)}")
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
-                self.root.after(0, lambda: self.status_var.set("Error occurred"))
-        
-        thread = threading.Thread(target=process_file)
-        thread.daemon = True
-        thread.start()
+        # Drop the previous load if it hasn't started, so the pool isn't busy with stale files
+        if self._current_future is not None:
+            self._current_future.cancel()
+        
+        # Load on the worker pool and apply the result on the UI thread
+        future = _worker_pool.submit(load_class_file, class_file)
+        self._current_future = future
+        future.add_done_callback(lambda f: self.root.after(0, self._on_class_loaded, f))
+    
+    def _on_class_loaded(self, future):
+        # Ignore results for a file the user has since moved away from
+        if future is not self._current_future:
+            return
+        try:
+            disassembled_code, decompiled_code, debugger = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            self.status_var.set("Error occurred")
+            return
+        self.debugger = debugger
+        self.update_ui(disassembled_code, decompiled_code)
     
     def update_ui(self, disassembled_code, decompiled_code):
+        # Keep the content for tabs that haven't been shown yet
+        self._disassembled_code = disassembled_code
+        self._decompiled_code = decompiled_code
+        
         # Update disassembly tab
-        self.disasm_text.delete(1.0, END)
-        self.disasm_text.insert(END, disassembled_code)
+        if self.disasm_text is not None:
+            self._set_text(self.disasm_text, disassembled_code)
         
         # Update decompiled tab
-        self.decompiled_text.delete(1.0, END)
-        self.decompiled_text.insert(END, decompiled_code)
+        if self.decompiled_text is not None:
+            self._set_text(self.decompiled_text, decompiled_code)
         
         # Update debug view
-        self.debug_bytecode_text.delete(1.0, END)
+        if self.debug_bytecode_text is not None:
+            self._fill_debug_view()
         
-        # Format the bytecode for easier debugging
-        formatted_bytecode = ""
-        for instr in self.debugger.instructions:
-            line = f"{instr['offset']}: {instr['opcode']} {instr['operands']}"
-            formatted_bytecode += line + "\n"
+        self.status_var.set("Ready")
+    
+    def _fill_debug_view(self):
+        """Show the current debugger's bytecode and reset the console panes"""
+        self._clear_highlight()
+        
+        # The debugger formats its bytecode once, one instruction per line
+        debugger = self.debugger
+        self._line_to_offset = dict(zip(range(1, len(debugger.offsets) + 1), debugger.offsets))
             
-        self.debug_bytecode_text.insert(END, formatted_bytecode)
+        self._set_text(self.debug_bytecode_text, debugger.formatted_bytecode)
+        self.debug_bytecode_text.mark_set("pc_mark", "1.0")
+        self._bytecode_line_count = len(debugger.instructions)
         
         # Clear console
-        self.console_text.delete(1.0, END)
-        self.console_text.insert(END, "Click 'Step' to execute one instruction at a time.\n")
-        self.console_text.insert(END, "Click 'Run to Breakpoint' to execute until the next breakpoint.\n")
-        self.console_text.insert(END, "Click 'Reset' to start over from the beginning.\n")
-        self.console_text.insert(END, "Set breakpoints by clicking on the line numbers.")
+        self.update_console(
+            "Click 'Step' to execute one instruction at a time.\n"
+            "Click 'Run to Breakpoint' to execute until the next breakpoint.\n"
+            "Click 'Reset' to start over from the beginning.\n"
+            "Set breakpoints by clicking on the line numbers."
+        )
         
-        self.status_var.set("Ready")
+        # Clear program output of the previous file
+        self._clear_output(self.program_output_text)
 
 # Main entry point
 if __name__ == "__main__":
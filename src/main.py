@@ -1,17 +1,14 @@
 import os
-import subprocess
 import argparse
 import tkinter as tk
-from decompiler_advanced import DecompilerApp, download_cfr, CFR_JAR_PATH
+from decompiler_advanced import DecompilerApp, download_cfr, java_available, CFR_JAR_PATH
 
 def check_java():
     """Check if Java is installed"""
-    try:
-        subprocess.run(['java', '-version'], capture_output=True)
+    if java_available():
         return True
-    except:
-        print("Error: Java is not installed or not in PATH")
-        return False
+    print("Error: Java is not installed or not in PATH")
+    return False
 
 def check_dependencies():
     """Check and download dependencies"""
@@ -63,11 +60,11 @@ def main():
         # Decompile
         from decompiler_advanced import decompile_class, disassemble_class
         decompiled = decompile_class(class_file)
-        disassembled = disassemble_class(class_file)
         print("Decompiled code:")
         print(decompiled)
         print("Disassembled code:")
-        print(disassembled)
+        for line in disassemble_class(class_file):
+            print(line, end='')
     else:
         # GUI mode
         root = tk.Tk()